@@ -47,8 +47,11 @@ def _synthesize_drums(midi_obj, fs):
     return audio
 
 
-def synthesize_preview(midi_dir: Path, output_path: Path) -> bool:
-    """Load 4 MIDI tracks, synthesize, mix, and write a WAV preview."""
+def _mix_tracks(midi_dir: Path):
+    """Load 4 MIDI tracks, synthesize, and mix to int16 samples.
+
+    Returns a numpy int16 array, or None if no tracks could be loaded.
+    """
     track_names = ["melody", "chords", "bass", "drums"]
     tracks = []
 
@@ -71,7 +74,7 @@ def synthesize_preview(midi_dir: Path, output_path: Path) -> bool:
 
     if not tracks:
         logger.error("No tracks to mix")
-        return False
+        return None
 
     # Pad to same length, mix, and trim
     max_len = max(len(t) for t in tracks)
@@ -88,6 +91,25 @@ def synthesize_preview(midi_dir: Path, output_path: Path) -> bool:
     if peak > 0:
         mixed = mixed / peak * 0.9
 
-    wavfile.write(str(output_path), SAMPLE_RATE, (mixed * 32767).astype(np.int16))
-    logger.info(f"Preview written: {output_path} ({mix_len / SAMPLE_RATE:.1f}s)")
+    return (mixed * 32767).astype(np.int16)
+
+
+def synthesize_preview(midi_dir: Path, output_path: Path) -> bool:
+    """Load 4 MIDI tracks, synthesize, mix, and write a WAV preview."""
+    mixed = _mix_tracks(midi_dir)
+    if mixed is None:
+        return False
+    wavfile.write(str(output_path), SAMPLE_RATE, mixed)
+    logger.info(f"Preview written: {output_path} ({len(mixed) / SAMPLE_RATE:.1f}s)")
     return True
+
+
+def synthesize_pcm(midi_dir: Path) -> bytes | None:
+    """Like synthesize_preview, but return raw mono s16le PCM bytes at
+    SAMPLE_RATE instead of writing a file — lets callers pipe the preview
+    straight into an encoder without a disk round-trip or WAV framing."""
+    mixed = _mix_tracks(midi_dir)
+    if mixed is None:
+        return None
+    logger.info(f"Preview synthesized: {len(mixed) / SAMPLE_RATE:.1f}s")
+    return mixed.tobytes()
@@ -2,14 +2,17 @@
 """One-time OAuth setup helper. Run locally to get a YouTube refresh token.
 
 Usage:
-    pip install google-auth-oauthlib requests
     python auth_setup.py --client-id YOUR_ID --client-secret YOUR_SECRET
+
+Stdlib-only on purpose — a one-shot script shouldn't require installing
+requests and its dependency tree just to POST one form.
 """
 
 import argparse
+import json
+import urllib.error
 import urllib.parse
-
-import requests
+import urllib.request
 
 
 SCOPES = ["https://www.googleapis.com/auth/youtube"]
@@ -54,19 +57,22 @@ def main():
     code = params["code"][0]
 
     # Exchange the code for tokens
-    resp = requests.post("https://oauth2.googleapis.com/token", data={
+    data = urllib.parse.urlencode({
         "code": code,
         "client_id": args.client_id,
         "client_secret": args.client_secret,
         "redirect_uri": REDIRECT_URI,
         "grant_type": "authorization_code",
-    })
-
-    if resp.status_code != 200:
-        print(f"\nError exchanging code for tokens: {resp.text}")
+    }).encode()
+
+    try:
+        with urllib.request.urlopen(
+            urllib.request.Request("https://oauth2.googleapis.com/token", data=data)
+        ) as resp:
+            tokens = json.loads(resp.read())
+    except urllib.error.HTTPError as e:
+        print(f"\nError exchanging code for tokens: {e.read().decode()}")
         return
-
-    tokens = resp.json()
     refresh_token = tokens.get("refresh_token")
 
     if not refresh_token:
@@ -8,9 +8,10 @@ import sys
 from pathlib import Path
 
 from slack_sdk import WebClient
+from slack_sdk.http_retry.builtin_handlers import RateLimitErrorRetryHandler
 
 from slack_scraper import find_channel_id, fetch_all_messages, extract_urls_from_messages
-from state import load_state, save_state, add_urls_to_state, get_new_urls
+from state import load_state, save_state, add_urls_to_state
 from youtube import get_youtube_client, process_backlog
 
 logging.basicConfig(
@@ -34,29 +35,34 @@ def main() -> int:
         logger.error("SLACK_BOT_TOKEN environment variable not set")
         return 1
 
-    client = WebClient(token=slack_token)
-    channel_id = find_channel_id(client, CHANNEL_NAME)
+    state = load_state(STATE_PATH)
+
+    # Honor Slack's Retry-After on 429s instead of aborting mid-pagination
+    client = WebClient(
+        token=slack_token,
+        retry_handlers=[RateLimitErrorRetryHandler(max_retry_count=5)],
+    )
+    channel_id = find_channel_id(client, CHANNEL_NAME, state)
     if not channel_id:
         logger.error(f"Channel {CHANNEL_NAME} not found")
         return 1
     logger.info(f"Found channel {CHANNEL_NAME}: {channel_id}")
 
-    messages = fetch_all_messages(client, channel_id)
+    messages = fetch_all_messages(client, channel_id, oldest=state.get("last_ts"))
+    if messages:
+        state["last_ts"] = max(messages, key=lambda m: float(m["ts"]))["ts"]
     url_entries = extract_urls_from_messages(messages)
     logger.info(f"Extracted {len(url_entries)} unique URLs ({sum(1 for u in url_entries if u['type'] == 'youtube')} YouTube)")
 
     # --- State management ---
-    state = load_state(STATE_PATH)
-    new_urls = get_new_urls(url_entries, state["urls"])
-    logger.info(f"Found {len(new_urls)} new URLs")
+    new_count = add_urls_to_state(state, url_entries)
+    logger.info(f"Found {new_count} new URLs")
 
-    if not new_urls and not state["backlog"]:
+    if not new_count and not state["backlog"]:
         logger.info("Nothing new and backlog is empty — done")
         save_state(state, STATE_PATH)
         return 0
 
-    add_urls_to_state(state, new_urls)
-
     # --- YouTube playlist ---
     if args.dry_run:
         logger.info(f"[DRY RUN] Backlog has {len(state['backlog'])} videos")
@@ -5,20 +5,19 @@ import logging
 
 from slack_sdk import WebClient
 
-from urls import extract_urls, extract_video_id, classify_url
+from urls import extract_urls, parse_youtube_url
 
 logger = logging.getLogger(__name__)
 
 
-def find_channel_id(client: WebClient, channel_name: str) -> str | None:
-    """Find a channel ID by name. Returns None if not found."""
-    name = channel_name.lstrip("#")
+def _scan_channels(list_method, name: str) -> str | None:
+    """Page through a channel-listing API method looking for a name match."""
     cursor = None
     while True:
-        kwargs = {"types": "public_channel", "limit": 200}
+        kwargs = {"types": "public_channel", "exclude_archived": True, "limit": 1000}
         if cursor:
             kwargs["cursor"] = cursor
-        resp = client.conversations_list(**kwargs)
+        resp = list_method(**kwargs)
         for ch in resp["channels"]:
             if ch["name"] == name:
                 return ch["id"]
@@ -28,12 +27,39 @@ def find_channel_id(client: WebClient, channel_name: str) -> str | None:
     return None
 
 
-def fetch_all_messages(client: WebClient, channel_id: str) -> list[dict]:
-    """Fetch ALL channel messages (no time limit)."""
+def find_channel_id(client: WebClient, channel_name: str, state: dict | None = None) -> str | None:
+    """Find a channel ID by name. Returns None if not found.
+
+    Uses the cached ID in state["channel_id"] when available, so warm runs
+    skip the lookup entirely. On a cold run, scans the bot's own channels
+    via users.conversations first (a much smaller set than the workspace
+    listing), falling back to conversations.list if the bot isn't a member.
+    The resolved ID is written back into state for the next run.
+    """
+    if state and state.get("channel_id"):
+        return state["channel_id"]
+    name = channel_name.lstrip("#")
+    channel_id = _scan_channels(client.users_conversations, name)
+    if not channel_id:
+        channel_id = _scan_channels(client.conversations_list, name)
+    if channel_id and state is not None:
+        state["channel_id"] = channel_id
+    return channel_id
+
+
+def fetch_all_messages(client: WebClient, channel_id: str, oldest: str | None = None) -> list[dict]:
+    """Fetch channel messages, newest first.
+
+    With oldest set (a Slack timestamp from a previous run), only messages
+    newer than that are fetched — warm runs typically need a single page
+    instead of re-scanning the whole channel.
+    """
     messages = []
     cursor = None
     while True:
-        kwargs = {"channel": channel_id, "limit": 200}
+        kwargs = {"channel": channel_id, "limit": 1000}
+        if oldest:
+            kwargs["oldest"] = oldest
         if cursor:
             kwargs["cursor"] = cursor
         resp = client.conversations_history(**kwargs)
@@ -45,10 +71,41 @@ def fetch_all_messages(client: WebClient, channel_id: str) -> list[dict]:
     return messages
 
 
+_DATE_CACHE: dict[int, str] = {}
+
+
+def _civil_from_days(days: int) -> tuple[int, int, int]:
+    """Days since the Unix epoch -> (year, month, day).
+
+    Howard Hinnant's civil_from_days algorithm — pure integer math, no
+    datetime objects.
+    """
+    z = days + 719468
+    era = (z if z >= 0 else z - 146096) // 146097
+    doe = z - era * 146097
+    yoe = (doe - doe // 1460 + doe // 36524 - doe // 146096) // 365
+    y = yoe + era * 400
+    doy = doe - (365 * yoe + yoe // 4 - yoe // 100)
+    mp = (5 * doy + 2) // 153
+    d = doy - (153 * mp + 2) // 5 + 1
+    m = mp + 3 if mp < 10 else mp - 9
+    return y + (1 if m <= 2 else 0), m, d
+
+
 def _ts_to_date(ts: str) -> str:
-    """Convert a Slack timestamp to a UTC date string."""
-    from datetime import datetime, timezone
-    return datetime.fromtimestamp(float(ts), tz=timezone.utc).strftime("%Y-%m-%d")
+    """Convert a Slack timestamp to a UTC date string.
+
+    Called once per message, so this avoids datetime entirely: the day
+    count is computed with integer arithmetic and the formatted string is
+    memoized per day (consecutive messages almost always share a date).
+    """
+    days = int(float(ts)) // 86400
+    date = _DATE_CACHE.get(days)
+    if date is None:
+        y, m, d = _civil_from_days(days)
+        date = f"{y:04d}-{m:02d}-{d:02d}"
+        _DATE_CACHE[days] = date
+    return date
 
 
 def extract_urls_from_messages(messages: list[dict]) -> list[dict]:
@@ -63,18 +120,20 @@ def extract_urls_from_messages(messages: list[dict]) -> list[dict]:
         if not text:
             continue
         urls = extract_urls(text)
+        if not urls:
+            # Most messages are chatter — don't compute date/user for them
+            continue
         date = _ts_to_date(msg["ts"])
         user = msg.get("user", "unknown")
         for url in urls:
             if url in seen_urls:
                 continue
             seen_urls.add(url)
-            url_type = classify_url(url)
-            video_id = extract_video_id(url) if url_type == "youtube" else None
+            is_youtube, video_id = parse_youtube_url(url)
             results.append({
                 "url": url,
                 "video_id": video_id,
-                "type": url_type,
+                "type": "youtube" if is_youtube else "other",
                 "date": date,
                 "user": user,
             })
@@ -3,7 +3,14 @@
 import json
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 DEFAULT_STATE = {
+    "channel_id": None,
+    "last_ts": None,
     "playlists": [],
     "urls": [],
     "backlog": [],
@@ -13,43 +20,90 @@ DEFAULT_STATE = {
 def load_state(path: Path) -> dict:
     """Load state from disk. Returns default state if file doesn't exist."""
     if path.exists():
-        return json.loads(path.read_text())
+        if orjson is not None:
+            return orjson.loads(path.read_bytes())
+        with path.open("r") as f:
+            return json.load(f)
     return dict(DEFAULT_STATE)
 
 
 def save_state(state: dict, path: Path) -> None:
-    """Save state to disk."""
+    """Save state to disk.
+
+    Uses orjson when available — it serializes straight to bytes, several
+    times faster than stdlib json and without the intermediate str. The
+    fallback streams via json.dump rather than materializing the full
+    document with dumps.
+    """
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(state, indent=2) + "\n")
+    # Underscore-prefixed keys are in-memory indexes, not persisted
+    state = {k: v for k, v in state.items() if not k.startswith("_")}
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(
+            state, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+        ))
+    else:
+        with path.open("w") as f:
+            json.dump(state, f, indent=2)
+            f.write("\n")
+
+
+def url_index(state: dict) -> dict:
+    """Map url -> url entry. Built once per process, cached on the state
+    dict under an underscore key so save_state won't serialize it."""
+    index = state.get("_url_index")
+    if index is None:
+        index = {u["url"]: u for u in state["urls"]}
+        state["_url_index"] = index
+    return index
 
 
-def get_new_urls(candidates: list[dict], existing: list[dict]) -> list[dict]:
-    """Return only URLs not already in the existing list."""
-    known = {e["url"] for e in existing}
-    return [c for c in candidates if c["url"] not in known]
+def video_index(state: dict) -> dict:
+    """Map video_id -> first url entry not yet added to the playlist.
+    Cached like url_index; add_urls_to_state keeps it current."""
+    index = state.get("_video_index")
+    if index is None:
+        index = {}
+        for u in state["urls"]:
+            if u.get("video_id") and not u["added_to_playlist"]:
+                index.setdefault(u["video_id"], u)
+        state["_video_index"] = index
+    return index
 
 
-def add_urls_to_state(state: dict, new_urls: list[dict]) -> None:
+def add_urls_to_state(state: dict, new_urls: list[dict]) -> int:
     """Add new URLs to state. YouTube URLs also get added to backlog.
 
-    New YouTube videos are prepended to backlog (newest get priority).
-    Mutates state in place.
+    Already-known URLs are skipped, so callers can pass the raw scrape
+    results. New YouTube videos are prepended to backlog (newest get
+    priority). Mutates state in place and returns the number of URLs added.
     """
-    known = {e["url"] for e in state["urls"]}
+    known = url_index(state)
+    videos = video_index(state)
+    backlog_ids = set(state["backlog"])
     new_video_ids = []
+    added = 0
     for entry in new_urls:
         if entry["url"] in known:
             continue
-        state["urls"].append({
+        record = {
             "url": entry["url"],
             "video_id": entry.get("video_id"),
             "type": entry["type"],
             "added_to_playlist": False,
             "date": entry.get("date"),
             "user": entry.get("user"),
-        })
-        known.add(entry["url"])
-        if entry["type"] == "youtube" and entry.get("video_id"):
-            new_video_ids.append(entry["video_id"])
+        }
+        state["urls"].append(record)
+        known[entry["url"]] = record
+        added += 1
+        video_id = entry.get("video_id")
+        if entry["type"] == "youtube" and video_id:
+            videos.setdefault(video_id, record)
+            # The same video posted under two URLs should only cost one insert
+            if video_id not in backlog_ids:
+                backlog_ids.add(video_id)
+                new_video_ids.append(video_id)
     # Prepend new videos to backlog (newest first)
     state["backlog"] = new_video_ids + state["backlog"]
+    return added
@@ -2,7 +2,7 @@
 
 import json
 from pathlib import Path
-from state import load_state, save_state, add_urls_to_state, get_new_urls, DEFAULT_STATE
+from state import load_state, save_state, add_urls_to_state, DEFAULT_STATE
 
 
 class TestLoadSaveState:
@@ -28,6 +28,14 @@ class TestLoadSaveState:
         save_state(DEFAULT_STATE, path)
         assert path.exists()
 
+    def test_save_strips_in_memory_indexes(self, tmp_path):
+        path = tmp_path / "state.json"
+        state = dict(DEFAULT_STATE)
+        state["_url_index"] = {"https://youtu.be/abc": {}}
+        save_state(state, path)
+        loaded = load_state(path)
+        assert "_url_index" not in loaded
+
 
 class TestAddUrlsToState:
     def test_adds_new_url(self):
@@ -71,14 +79,36 @@ class TestAddUrlsToState:
         add_urls_to_state(state, new)
         assert state["backlog"] == ["new1", "old1", "old2"]
 
+    def test_same_video_id_only_queued_once(self):
+        state = {"playlists": [], "urls": [], "backlog": []}
+        new = [
+            {"url": "https://youtu.be/abc", "video_id": "abc", "type": "youtube",
+             "date": "2025-01-01", "user": "U1"},
+            {"url": "https://www.youtube.com/watch?v=abc", "video_id": "abc", "type": "youtube",
+             "date": "2025-01-01", "user": "U2"},
+        ]
+        add_urls_to_state(state, new)
+        assert len(state["urls"]) == 2
+        assert state["backlog"] == ["abc"]
+
+    def test_video_already_in_backlog_not_requeued(self):
+        state = {"playlists": [], "urls": [], "backlog": ["abc"]}
+        new = [{"url": "https://youtu.be/abc", "video_id": "abc", "type": "youtube",
+                "date": "2025-01-01", "user": "U1"}]
+        add_urls_to_state(state, new)
+        assert state["backlog"] == ["abc"]
 
-class TestGetNewUrls:
-    def test_filters_known_urls(self):
-        existing = [{"url": "https://youtu.be/abc"}]
+    def test_returns_count_of_new_urls(self):
+        state = {
+            "playlists": [], "backlog": [],
+            "urls": [{"url": "https://youtu.be/abc", "video_id": "abc", "type": "youtube",
+                       "added_to_playlist": True, "date": "2025-01-01", "user": "U1"}],
+        }
         candidates = [
-            {"url": "https://youtu.be/abc"},
-            {"url": "https://youtu.be/def"},
+            {"url": "https://youtu.be/abc", "video_id": "abc", "type": "youtube",
+             "date": "2025-01-01", "user": "U1"},
+            {"url": "https://youtu.be/def", "video_id": "def", "type": "youtube",
+             "date": "2025-01-02", "user": "U1"},
         ]
-        new = get_new_urls(candidates, existing)
-        assert len(new) == 1
-        assert new[0]["url"] == "https://youtu.be/def"
+        assert add_urls_to_state(state, candidates) == 1
+        assert len(state["urls"]) == 2
@@ -1,6 +1,6 @@
 """Tests for URL extraction and classification."""
 
-from urls import extract_urls, extract_video_id, classify_url
+from urls import extract_urls, extract_video_id, classify_url, parse_youtube_url
 
 
 class TestExtractUrls:
@@ -69,6 +69,32 @@ class TestExtractVideoId:
         assert extract_video_id("https://music.youtube.com/watch?v=dQw4w9WgXcQ") == "dQw4w9WgXcQ"
 
 
+class TestParseYoutubeUrl:
+    def test_standard_watch_url(self):
+        assert parse_youtube_url("https://www.youtube.com/watch?v=dQw4w9WgXcQ") == (True, "dQw4w9WgXcQ")
+
+    def test_short_url(self):
+        assert parse_youtube_url("https://youtu.be/dQw4w9WgXcQ") == (True, "dQw4w9WgXcQ")
+
+    def test_shorts_url(self):
+        assert parse_youtube_url("https://youtube.com/shorts/dQw4w9WgXcQ") == (True, "dQw4w9WgXcQ")
+
+    def test_music_youtube(self):
+        assert parse_youtube_url("https://music.youtube.com/watch?v=dQw4w9WgXcQ") == (True, "dQw4w9WgXcQ")
+
+    def test_with_extra_params(self):
+        assert parse_youtube_url("https://youtube.com/watch?v=abc123&t=120&list=PLxyz") == (True, "abc123")
+
+    def test_non_youtube(self):
+        assert parse_youtube_url("https://soundcloud.com/foo") == (False, None)
+
+    def test_youtube_channel_no_video_id(self):
+        assert parse_youtube_url("https://youtube.com/channel/UCabc") == (True, None)
+
+    def test_youtube_playlist_url(self):
+        assert parse_youtube_url("https://youtube.com/playlist?list=PLabc") == (True, None)
+
+
 class TestClassifyUrl:
     def test_youtube_watch(self):
         assert classify_url("https://youtube.com/watch?v=abc") == "youtube"
@@ -1,42 +1,81 @@
 """URL extraction and classification utilities."""
 
-import re
 from urllib.parse import urlparse, parse_qs
 
+_YT_HOSTS = frozenset({"youtube.com", "youtu.be", "music.youtube.com"})
+_YT_WATCH_HOSTS = frozenset({"youtube.com", "music.youtube.com"})
+
+# Characters that terminate a plain (non-angle-bracket) URL
+_PLAIN_URL_STOPS = frozenset("<>\"')]")
+
 
 def extract_urls(text: str) -> list[str]:
     """Extract all URLs from Slack message text.
 
-    Handles Slack's angle-bracket format: <url> and <url|label>
+    Handles Slack's angle-bracket format: <url> and <url|label>.
+
+    Implemented as a manual scan for "http" prefixes rather than a regex —
+    Python's backtracking re engine degrades badly on message soup (long
+    runs of URL-ish characters), and the scan is linear by construction.
     """
     urls = []
-    # Slack-formatted URLs: <url> or <url|label>
-    for match in re.finditer(r"<(https?://[^>|]+)(?:\|[^>]*)?>", text):
-        urls.append(match.group(1))
-    # Plain URLs not in angle brackets
-    # Negative lookbehind for < to avoid double-matching Slack URLs
-    for match in re.finditer(r"(?<![\<|])https?://[^\s<>\"')\]]+", text):
-        url = match.group(0)
-        if url not in urls:
+    seen = set()
+    pos = 0
+    n = len(text)
+    while True:
+        i = text.find("http", pos)
+        if i < 0:
+            break
+        if text.startswith("https://", i):
+            scheme_end = i + 8
+        elif text.startswith("http://", i):
+            scheme_end = i + 7
+        else:
+            pos = i + 4
+            continue
+
+        prev = text[i - 1] if i > 0 else ""
+        if prev == "<":
+            # Slack format: <url> or <url|label> — URL runs to | or >
+            j = scheme_end
+            while j < n and text[j] not in ">|":
+                j += 1
+            url = text[i:j]
+            # Require a closing > (skipping any |label part)
+            close = text.find(">", j)
+            if close < 0:
+                break  # unterminated bracket, nothing more to find
+            pos = close + 1
+            if j == scheme_end:
+                continue  # nothing after the scheme
+        elif prev == "|":
+            # Inside a <url|label> label — already captured above
+            pos = scheme_end
+            continue
+        else:
+            j = scheme_end
+            while j < n and not text[j].isspace() and text[j] not in _PLAIN_URL_STOPS:
+                j += 1
+            url = text[i:j]
+            pos = j
+            if j == scheme_end:
+                continue
+
+        if url not in seen:
+            seen.add(url)
             urls.append(url)
     return urls
 
 
-def extract_video_id(url: str) -> str | None:
-    """Extract a YouTube video ID from a URL. Returns None if not a video URL."""
-    parsed = urlparse(url)
-    host = parsed.hostname or ""
-    # Strip www. prefix
-    if host.startswith("www."):
-        host = host[4:]
-
+def _video_id_from(parsed, host: str) -> str | None:
+    """Extract a video ID from an already-parsed YouTube URL."""
     # youtu.be/VIDEO_ID
     if host == "youtu.be":
         video_id = parsed.path.lstrip("/").split("/")[0]
         return video_id if video_id else None
 
     # youtube.com or music.youtube.com
-    if host not in ("youtube.com", "music.youtube.com"):
+    if host not in _YT_WATCH_HOSTS:
         return None
 
     path = parsed.path
@@ -55,12 +94,54 @@ def extract_video_id(url: str) -> str | None:
     return None
 
 
-def classify_url(url: str) -> str:
-    """Classify a URL as 'youtube' or 'other'."""
+def extract_video_id(url: str) -> str | None:
+    """Extract a YouTube video ID from a URL. Returns None if not a video URL."""
     parsed = urlparse(url)
     host = parsed.hostname or ""
+    # Strip www. prefix
     if host.startswith("www."):
         host = host[4:]
-    if host in ("youtube.com", "youtu.be", "music.youtube.com"):
+    return _video_id_from(parsed, host)
+
+
+def parse_youtube_url(url: str) -> tuple[bool, str | None]:
+    """Classify a URL and extract its video ID in one pass.
+
+    Returns (is_youtube, video_id). The cheap host check gates the full
+    urlparse, so non-YouTube URLs (the common case) never pay for it and
+    YouTube URLs are parsed exactly once.
+    """
+    host = _host_of(url)
+    if host not in _YT_HOSTS:
+        return False, None
+    return True, _video_id_from(urlparse(url), host)
+
+
+def _host_of(url: str) -> str:
+    """Extract the lowercased host from a URL with plain string ops.
+
+    Much cheaper than urlparse (no regex, no SplitResult allocation) for
+    the hot classify path; URLs with ports or userinfo fall through to
+    "other", which is fine for the hosts we care about.
+    """
+    if url.startswith("https://"):
+        rest = url[8:]
+    elif url.startswith("http://"):
+        rest = url[7:]
+    else:
+        rest = url
+    if rest.startswith("www."):
+        rest = rest[4:]
+    end = len(rest)
+    for sep in "/?#":
+        i = rest.find(sep)
+        if 0 <= i < end:
+            end = i
+    return rest[:end].lower()
+
+
+def classify_url(url: str) -> str:
+    """Classify a URL as 'youtube' or 'other'."""
+    if _host_of(url) in _YT_HOSTS:
         return "youtube"
     return "other"
@@ -2,20 +2,47 @@
 """YouTube Data API v3 playlist management."""
 
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
+import httplib2
+from google_auth_httplib2 import AuthorizedHttp
 from google.oauth2.credentials import Credentials
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
+from state import video_index
+
 logger = logging.getLogger(__name__)
 
 SCOPES = ["https://www.googleapis.com/auth/youtube"]
 MAX_PLAYLIST_SIZE = 5000
 DAILY_INSERT_CAP = 190  # ~10,000 quota / 50 units per insert, with headroom
+MAX_INSERT_WORKERS = 4  # bounded pool for concurrent playlistItems.insert
+
+_thread_local = threading.local()
+
+
+def _thread_http(youtube):
+    """Return an authorized http object private to the calling thread.
+
+    googleapiclient's default http is not thread-safe, so each insert
+    worker gets its own httplib2.Http wrapped with the client's credentials.
+    """
+    http = getattr(_thread_local, "http", None)
+    if http is None:
+        http = AuthorizedHttp(youtube._http.credentials, http=httplib2.Http())
+        _thread_local.http = http
+    return http
 
 
 def get_youtube_client(client_id: str, client_secret: str, refresh_token: str):
-    """Build an authenticated YouTube API client using a refresh token."""
+    """Build an authenticated YouTube API client using a refresh token.
+
+    static_discovery uses the discovery document bundled with the client
+    library instead of fetching it from googleapis.com on every process
+    start.
+    """
     creds = Credentials(
         token=None,
         refresh_token=refresh_token,
@@ -23,7 +50,7 @@ def get_youtube_client(client_id: str, client_secret: str, refresh_token: str):
         client_secret=client_secret,
         token_uri="https://oauth2.googleapis.com/token",
     )
-    return build("youtube", "v3", credentials=creds)
+    return build("youtube", "v3", credentials=creds, static_discovery=True)
 
 
 def create_playlist(youtube, title: str) -> str:
@@ -40,7 +67,7 @@ def create_playlist(youtube, title: str) -> str:
     return playlist_id
 
 
-def add_video_to_playlist(youtube, playlist_id: str, video_id: str) -> bool:
+def add_video_to_playlist(youtube, playlist_id: str, video_id: str, http=None) -> bool:
     """Add a video to a playlist at position 0 (top). Returns True on success."""
     try:
         youtube.playlistItems().insert(
@@ -52,7 +79,7 @@ def add_video_to_playlist(youtube, playlist_id: str, video_id: str) -> bool:
                     "resourceId": {"kind": "youtube#video", "videoId": video_id},
                 },
             },
-        ).execute()
+        ).execute(http=http)
         logger.info(f"Added {video_id} to playlist {playlist_id}")
         return True
     except HttpError as e:
@@ -86,26 +113,90 @@ def get_or_create_playlist(youtube, state: dict) -> tuple[str, dict]:
     return playlist_id, entry
 
 
-def get_playlist_video_ids(youtube, playlist_id: str) -> set[str]:
-    """Fetch all video IDs currently in a playlist."""
+def get_playlist_video_ids(youtube, playlist_entry: dict) -> set[str]:
+    """Fetch all video IDs currently in a playlist.
+
+    The ID set and first-page ETag are cached in the playlist's state
+    entry; the list request sends If-None-Match, so when the playlist is
+    unchanged the API answers 304 and the cached set is returned without
+    re-paginating. Otherwise the cache is refreshed in place.
+    """
+    playlist_id = playlist_entry["id"]
+    cached = playlist_entry.get("video_ids")
+    etag = playlist_entry.get("etag")
     video_ids = set()
     try:
         request = youtube.playlistItems().list(
             part="contentDetails", playlistId=playlist_id, maxResults=50
         )
+        if etag and cached is not None:
+            request.headers["If-None-Match"] = etag
+        first_page = True
         while request:
             resp = request.execute()
+            if first_page:
+                playlist_entry["etag"] = resp.get("etag")
+                first_page = False
             for item in resp.get("items", []):
                 video_ids.add(item["contentDetails"]["videoId"])
             request = youtube.playlistItems().list_next(request, resp)
     except HttpError as e:
+        if e.resp.status == 304:
+            logger.info(f"Playlist {playlist_id} unchanged (ETag hit), using cached {len(cached)} video IDs")
+            return set(cached)
         if e.resp.status == 404:
             logger.info(f"Playlist {playlist_id} not listable yet (newly created), assuming empty")
+            playlist_entry["video_ids"] = []
             return set()
         raise
+    playlist_entry["video_ids"] = sorted(video_ids)
     return video_ids
 
 
+def filter_live_video_ids(youtube, video_ids: list[str]) -> set[str]:
+    """Return the subset of video_ids that still exist on YouTube.
+
+    videos.list validates 50 IDs for 1 quota unit, versus 50 units burned
+    by each playlistItems.insert that fails on a deleted/blocked video.
+    """
+    live = set()
+    for i in range(0, len(video_ids), 50):
+        chunk = video_ids[i:i + 50]
+        resp = youtube.videos().list(part="id", id=",".join(chunk)).execute()
+        live.update(item["id"] for item in resp.get("items", []))
+    return live
+
+
+def _insert_one(youtube, playlist_id: str, video_id: str) -> bool:
+    """Worker entry point: insert using the calling thread's own http."""
+    return add_video_to_playlist(youtube, playlist_id, video_id, http=_thread_http(youtube))
+
+
+def _insert_batch(youtube, playlist_id: str, batch: list[str]) -> list[tuple]:
+    """Insert a batch of videos concurrently with a bounded thread pool.
+
+    Returns (video_id, outcome) pairs in submission order, where outcome is
+    the bool from add_video_to_playlist or the HttpError raised for quota
+    exhaustion. Inserts are I/O-bound round-trips, so overlapping a few of
+    them cuts the wall time of the insert phase roughly by the pool size.
+    """
+    if not batch:
+        return []
+    results = {}
+    with ThreadPoolExecutor(max_workers=MAX_INSERT_WORKERS) as pool:
+        futures = {
+            pool.submit(_insert_one, youtube, playlist_id, vid): vid
+            for vid in batch
+        }
+        for future in as_completed(futures):
+            vid = futures[future]
+            try:
+                results[vid] = future.result()
+            except HttpError as e:
+                results[vid] = e
+    return [(vid, results[vid]) for vid in batch]
+
+
 def process_backlog(youtube, state: dict, dry_run: bool = False) -> int:
     """Process the video backlog, adding up to DAILY_INSERT_CAP videos.
 
@@ -125,55 +216,70 @@ def process_backlog(youtube, state: dict, dry_run: bool = False) -> int:
     remaining = []
 
     # Fetch existing playlist contents to avoid duplicates
-    existing_ids = get_playlist_video_ids(youtube, playlist_id)
+    existing_ids = get_playlist_video_ids(youtube, playlist_entry)
     if existing_ids:
         logger.info(f"Playlist already has {len(existing_ids)} videos, will skip duplicates")
 
-    # Build lookup for marking urls as added
-    video_id_to_url = {}
-    for u in state["urls"]:
-        if u.get("video_id") and not u["added_to_playlist"]:
-            video_id_to_url.setdefault(u["video_id"], u)
+    # Lookup for marking urls as added (cached on the state dict)
+    video_id_to_url = video_index(state)
 
     skipped_dupes = 0
     quota_exceeded = False
-    backlog_iter = iter(state["backlog"])
-    for video_id in backlog_iter:
-        if added >= DAILY_INSERT_CAP:
-            remaining.append(video_id)
-            continue
-
-        # Skip videos already in the playlist
-        if video_id in existing_ids:
-            skipped_dupes += 1
-            if video_id in video_id_to_url:
-                video_id_to_url[video_id]["added_to_playlist"] = True
-            continue
-
+    backlog = state["backlog"]
+    idx = 0
+    while idx < len(backlog) and added < DAILY_INSERT_CAP and not quota_exceeded:
         # Check if we need a new playlist
         if playlist_entry["count"] >= MAX_PLAYLIST_SIZE:
             playlist_id, playlist_entry = get_or_create_playlist(youtube, state)
-            existing_ids = get_playlist_video_ids(youtube, playlist_id)
-
-        try:
-            success = add_video_to_playlist(youtube, playlist_id, video_id)
-        except HttpError:
-            # Quota exceeded — save progress for remaining videos
-            logger.warning("Quota exceeded, saving progress and stopping")
-            remaining.append(video_id)
-            quota_exceeded = True
-            break
-
-        if success:
-            playlist_entry["count"] += 1
-            added += 1
+            existing_ids = get_playlist_video_ids(youtube, playlist_entry)
+
+        # Collect the next batch that fits the daily cap and current playlist
+        batch = []
+        batch_size = min(DAILY_INSERT_CAP - added, MAX_PLAYLIST_SIZE - playlist_entry["count"])
+        while idx < len(backlog) and len(batch) < batch_size:
+            video_id = backlog[idx]
+            idx += 1
+            # Skip videos already in the playlist (or earlier in this batch)
+            if video_id in existing_ids:
+                skipped_dupes += 1
+                if video_id in video_id_to_url:
+                    video_id_to_url[video_id]["added_to_playlist"] = True
+                continue
+            batch.append(video_id)
             existing_ids.add(video_id)
-        # Mark as added in urls list (even if video was unavailable — don't retry)
-        if video_id in video_id_to_url:
-            video_id_to_url[video_id]["added_to_playlist"] = True
 
-    # Collect any unprocessed videos from the iterator
-    remaining.extend(backlog_iter)
+        # Weed out dead videos cheaply before paying insert quota for them
+        if batch:
+            live = filter_live_video_ids(youtube, batch)
+            dead = [vid for vid in batch if vid not in live]
+            if dead:
+                logger.info(f"Skipping {len(dead)} videos no longer available on YouTube")
+                for vid in dead:
+                    existing_ids.discard(vid)
+                    if vid in video_id_to_url:
+                        video_id_to_url[vid]["added_to_playlist"] = True
+                batch = [vid for vid in batch if vid in live]
+
+        for video_id, outcome in _insert_batch(youtube, playlist_id, batch):
+            if isinstance(outcome, HttpError):
+                # Quota exceeded — save progress for remaining videos
+                logger.warning("Quota exceeded, saving progress and stopping")
+                remaining.append(video_id)
+                existing_ids.discard(video_id)
+                quota_exceeded = True
+                continue
+            if outcome:
+                playlist_entry["count"] += 1
+                added += 1
+                playlist_entry.setdefault("video_ids", []).append(video_id)
+            else:
+                existing_ids.discard(video_id)
+            # Mark as added in urls list (even if video was unavailable — don't retry)
+            if video_id in video_id_to_url:
+                video_id_to_url[video_id]["added_to_playlist"] = True
+
+    # Collect any unprocessed videos
+    remaining.extend(backlog[idx:])
     state["backlog"] = remaining
     logger.info(f"Added {added} videos, skipped {skipped_dupes} duplicates, {len(remaining)} remaining in backlog")
     if quota_exceeded:
@@ -1,46 +1,130 @@
 """Scrape #midieval Slack channel and archive MIDI bot output."""
+import functools
 import importlib.util
 import json
 import logging
+import operator
 import os
 import re
 import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 from pathlib import Path
 
 import requests
+from requests.adapters import HTTPAdapter, Retry
 from slack_sdk import WebClient
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+
+def _json_loads(data):
+    """Parse JSON bytes/str, preferring orjson's Rust parser when installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj) -> bytes:
+    """Serialize to indented JSON bytes with a trailing newline."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj, indent=2) + "\n").encode()
+
+# Shared session so repeated downloads reuse pooled TCP+TLS connections to
+# Slack's file CDN instead of handshaking per request
+_SESSION = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504]),
+)
+_SESSION.mount("https://", _adapter)
+_SESSION.mount("http://", _adapter)
+
 PUKE_BOX_DIR = Path(__file__).parent
 MANIFEST_PATH = PUKE_BOX_DIR / "manifest.json"
+CHANNEL_CACHE_PATH = PUKE_BOX_DIR / ".channel_cache.json"
 
 CHANNEL_NAME = "midieval"
 MIDI_FILENAMES = {"melody.mid", "drums.mid", "bass.mid", "chords.mid"}
 
+# Archive directory names: YYYY-MM-DD or YYYY-MM-DD-HHMMSS
+_DATE_DIR_RE = re.compile(r"\d{4}-\d{2}-\d{2}(-\d{6})?\Z")
 
-def parse_midi_message(text: str) -> dict | None:
-    """Parse a Daily MIDI message into structured metadata. Returns None if not a match."""
-    header = re.search(
-        r'\*Daily MIDI\*\s*—\s*(.+?)\s+in\s+(\w[#b]?)\s+\((\d+)\s*BPM\)', text
-    )
+# All message fields as one alternation so a single scan finds everything;
+# the first match per named group wins, mirroring the old per-field re.search
+_MIDI_RE = re.compile(
+    r'\*Daily MIDI\*\s*—\s*(?P<scale>.+?)\s+in\s+(?P<root>\w[#b]?)\s+\((?P<tempo>\d+)\s*BPM\)'
+    r'|_(?P<desc>.+?)_'
+    r'|:musical_score: Chords\s*—\s*(?P<chords>.+)'
+    r'|Melody.*?MIDI\s+(?P<melody>\d+)'
+    r'|temperature\s+(?P<temp>[\d.]+)'
+)
+
+
+@functools.lru_cache(maxsize=2048)
+def _parse_midi_fields(text: str) -> tuple | None:
+    """Regex-scan a message into an immutable field tuple, memoized per text.
+
+    Identical message bodies (e.g. full-history re-scrapes in one process)
+    hit the cache instead of re-running the scan. The cached value is a
+    tuple with chords as a tuple so no caller can mutate a shared entry.
+    """
+    # Cheap literal probe — most channel messages aren't Daily MIDI posts,
+    # and str.__contains__ rejects them far faster than the regex scan
+    if "Daily MIDI" not in text:
+        return None
+
+    fields = {}
+    for m in _MIDI_RE.finditer(text):
+        if m.group("scale") is not None:
+            key = "scale"
+        else:
+            key = m.lastgroup
+        if key not in fields:
+            fields[key] = m
+        if len(fields) == 5:
+            break
+
+    header = fields.get("scale")
     if not header:
         return None
 
-    scale, root, tempo = header.group(1), header.group(2), int(header.group(3))
+    scale, root, tempo = header.group("scale"), header.group("root"), int(header.group("tempo"))
+
+    desc_match = fields.get("desc")
+    description = desc_match.group("desc") if desc_match else ""
 
-    desc_match = re.search(r'_(.+?)_', text)
-    description = desc_match.group(1) if desc_match else ""
+    # chords stays tokenized: meta.json's published schema stores a list,
+    # and whitespace str.split() is already a single C-level scan
+    chords_match = fields.get("chords")
+    chords = tuple(chords_match.group("chords").split()) if chords_match else ()
 
-    chords_match = re.search(r':musical_score: Chords\s*—\s*(.+)', text)
-    chords = chords_match.group(1).split() if chords_match else []
+    melody_match = fields.get("melody")
+    melody_instrument = int(melody_match.group("melody")) if melody_match else 0
 
-    melody_match = re.search(r'Melody.*?MIDI\s+(\d+)', text)
-    melody_instrument = int(melody_match.group(1)) if melody_match else 0
+    temp_match = fields.get("temp")
+    temperature = float(temp_match.group("temp")) if temp_match else 1.0
 
-    temp_match = re.search(r'temperature\s+([\d.]+)', text)
-    temperature = float(temp_match.group(1)) if temp_match else 1.0
+    return (scale, root, tempo, description, chords, melody_instrument, temperature)
+
+
+def parse_midi_message(text: str) -> dict | None:
+    """Parse a Daily MIDI message into structured metadata. Returns None if not a match.
+
+    Returns a fresh dict per call (callers add date/entry_id/thread_ts keys),
+    built from the memoized field scan in _parse_midi_fields.
+    """
+    parsed = _parse_midi_fields(text)
+    if parsed is None:
+        return None
+    scale, root, tempo, description, chords, melody_instrument, temperature = parsed
 
     chord_instrument = 0
 
@@ -49,47 +133,104 @@ def parse_midi_message(text: str) -> dict | None:
         "root": root,
         "tempo": tempo,
         "description": description,
-        "chords": chords,
+        "chords": list(chords),
         "melody_instrument": melody_instrument,
         "chord_instrument": chord_instrument,
         "temperature": temperature,
     }
 
 
-def _download_with_auth(url: str, token: str, timeout: int = 30) -> bytes:
-    """Download a URL, manually following redirects to preserve the auth header.
+def _download_with_auth(url: str, token: str, dest_path: Path, timeout: int = 30) -> int | None:
+    """Download a URL to dest_path, manually following redirects to preserve
+    the auth header.
 
     The requests library strips Authorization headers on cross-domain redirects
     (a security feature). Slack's url_private_download redirects to a CDN on a
     different host, so we must follow redirects ourselves.
 
-    Returns the response body as bytes.
+    The body is streamed to disk in 64 KB chunks rather than buffered whole,
+    and the MIDI magic is checked on a 4-byte peek before any of the body is
+    read, so invalid files cost 4 bytes of transfer and never touch disk.
+    Returns the number of bytes written, or None if the body isn't a MIDI
+    file.
     """
     headers = {"Authorization": f"Bearer {token}"}
     max_redirects = 5
     for _ in range(max_redirects):
-        resp = requests.get(url, headers=headers, timeout=timeout, allow_redirects=False)
+        resp = _SESSION.get(url, headers=headers, timeout=timeout,
+                            allow_redirects=False, stream=True)
         if resp.status_code in (301, 302, 303, 307, 308):
+            resp.close()
             url = resp.headers["Location"]
             continue
-        resp.raise_for_status()
-        return resp.content
+        with resp:
+            resp.raise_for_status()
+            magic = resp.raw.read(4, decode_content=True)
+            if magic != b"MThd":
+                return None
+            # Stream into a sidecar name and rename once complete, so a
+            # connection error mid-transfer never leaves a truncated .mid
+            # at dest_path for the synthesizer to choke on
+            tmp_path = dest_path.with_name(dest_path.name + ".part")
+            size = len(magic)
+            try:
+                with open(tmp_path, "wb") as fh:
+                    fh.write(magic)
+                    for chunk in resp.iter_content(65536):
+                        fh.write(chunk)
+                        size += len(chunk)
+            except Exception:
+                tmp_path.unlink(missing_ok=True)
+                raise
+            tmp_path.replace(dest_path)
+        return size
     raise requests.TooManyRedirects(f"Too many redirects for {url}")
 
 
+def _read_channel_cache() -> dict:
+    """Read the scraper sidecar cache. Returns {} if missing or corrupt."""
+    try:
+        return json.loads(CHANNEL_CACHE_PATH.read_text())
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def _write_channel_cache(cache: dict) -> None:
+    """Persist the scraper sidecar cache (channel ID, last-scraped timestamp)."""
+    CHANNEL_CACHE_PATH.write_text(json.dumps(cache) + "\n")
+
+
 def find_channel_id(client: WebClient) -> str:
-    """Find the #midieval channel ID by paginating through conversations_list.
+    """Find the #midieval channel ID.
 
-    Raises ValueError if the channel is not found.
+    Channel IDs are stable, so the MIDIEVAL_CHANNEL_ID environment variable
+    bypasses the lookup entirely, and a resolved ID is cached on disk so
+    subsequent runs skip the conversations_list pagination (which can take
+    minutes on a large workspace). Raises ValueError if the channel is not
+    found.
     """
+    env_id = os.environ.get("MIDIEVAL_CHANNEL_ID")
+    if env_id:
+        return env_id
+
+    cache = _read_channel_cache()
+    if cache.get(CHANNEL_NAME):
+        return cache[CHANNEL_NAME]
+
+    logger.info(
+        "Scanning workspace channels for #%s — set MIDIEVAL_CHANNEL_ID "
+        "to skip this on future cold runs", CHANNEL_NAME
+    )
     cursor = None
     while True:
-        kwargs = {"types": "public_channel", "limit": 200}
+        kwargs = {"types": "public_channel", "exclude_archived": True, "limit": 1000}
         if cursor:
             kwargs["cursor"] = cursor
         resp = client.conversations_list(**kwargs)
         for ch in resp["channels"]:
             if ch["name"] == CHANNEL_NAME:
+                cache[CHANNEL_NAME] = ch["id"]
+                _write_channel_cache(cache)
                 return ch["id"]
         cursor = resp.get("response_metadata", {}).get("next_cursor")
         if not cursor:
@@ -97,19 +238,24 @@ def find_channel_id(client: WebClient) -> str:
     raise ValueError(f"Channel #{CHANNEL_NAME} not found")
 
 
-def fetch_midi_messages(client: WebClient, channel_id: str) -> list[dict]:
-    """Fetch all Daily MIDI messages from channel history.
+def fetch_midi_messages(client: WebClient, channel_id: str, oldest: str | None = None) -> list[dict]:
+    """Fetch Daily MIDI messages from channel history.
 
-    Uses cursor-based pagination to walk the full history. Each message is
-    parsed with parse_midi_message(); non-matching messages are skipped.
-    Adds "date" (UTC YYYY-MM-DD from timestamp) and "thread_ts" fields.
+    Uses cursor-based pagination to walk the history. With oldest set (the
+    last-scraped Slack timestamp from a previous run), only newer messages
+    are fetched, so incremental runs terminate after the delta instead of
+    re-walking the whole channel. Each message is parsed with
+    parse_midi_message(); non-matching messages are skipped. Adds "date"
+    (UTC YYYY-MM-DD from timestamp) and "thread_ts" fields.
 
     Returns a list of parsed metadata dicts.
     """
     results = []
     cursor = None
     while True:
-        kwargs = {"channel": channel_id, "limit": 200}
+        kwargs = {"channel": channel_id, "limit": 1000}
+        if oldest:
+            kwargs["oldest"] = oldest
         if cursor:
             kwargs["cursor"] = cursor
         resp = client.conversations_history(**kwargs)
@@ -118,7 +264,7 @@ def fetch_midi_messages(client: WebClient, channel_id: str) -> list[dict]:
             parsed = parse_midi_message(text)
             if parsed is None:
                 if text.strip():
-                    logger.debug(f"Skipped non-MIDI message: {text[:80]}")
+                    logger.debug("Skipped non-MIDI message: %s", text[:80])
                 continue
             ts = msg["ts"]
             dt = datetime.fromtimestamp(float(ts), tz=timezone.utc)
@@ -126,11 +272,11 @@ def fetch_midi_messages(client: WebClient, channel_id: str) -> list[dict]:
             parsed["entry_id"] = dt.strftime("%Y-%m-%d-%H%M%S")
             parsed["thread_ts"] = ts
             results.append(parsed)
-            logger.info(f"Matched: {parsed['entry_id']} — {parsed['scale']} in {parsed['root']}")
+            logger.info("Matched: %s — %s in %s", parsed["entry_id"], parsed["scale"], parsed["root"])
         cursor = resp.get("response_metadata", {}).get("next_cursor")
         if not cursor:
             break
-    logger.info(f"Found {len(results)} Daily MIDI messages")
+    logger.info("Found %d Daily MIDI messages", len(results))
     return results
 
 
@@ -147,125 +293,170 @@ def download_thread_midi_files(
     (melody.mid, drums.mid, bass.mid, chords.mid). Uses
     _download_with_auth to handle Slack's redirect-based downloads.
 
+    The files are independent round-trips against Slack's CDN, so they are
+    fetched concurrently with a small thread pool.
+
     Returns a list of downloaded filenames.
     """
     output_dir = Path(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    downloaded = []
+    to_fetch = []
     cursor = None
     while True:
-        kwargs = {"channel": channel_id, "ts": thread_ts, "limit": 200}
+        kwargs = {"channel": channel_id, "ts": thread_ts, "limit": 1000}
         if cursor:
             kwargs["cursor"] = cursor
         resp = client.conversations_replies(**kwargs)
         for msg in resp["messages"]:
             for f in msg.get("files", []):
                 name = f.get("name", "")
-                if name not in MIDI_FILENAMES:
+                # Skip repeats so two workers never write the same path
+                if name not in MIDI_FILENAMES or any(n == name for n, _ in to_fetch):
                     continue
                 url = f.get("url_private_download") or f.get("url_private")
                 if not url:
-                    logger.warning(f"No download URL for {name} in thread {thread_ts}")
+                    logger.warning("No download URL for %s in thread %s", name, thread_ts)
                     continue
-                try:
-                    data = _download_with_auth(url, token)
-                    if not data.startswith(b'MThd'):
-                        logger.warning(f"{name}: not a valid MIDI file, skipping")
-                        continue
-                    filepath = output_dir / name
-                    filepath.write_bytes(data)
-                    downloaded.append(name)
-                    logger.info(f"Downloaded {name} ({len(data)} bytes)")
-                except Exception as e:
-                    logger.error(f"Failed to download {name}: {e}")
+                to_fetch.append((name, url))
         cursor = resp.get("response_metadata", {}).get("next_cursor")
         if not cursor:
             break
+
+    downloaded = []
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = {
+            pool.submit(_download_with_auth, url, token, output_dir / name): name
+            for name, url in to_fetch
+        }
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                size = future.result()
+                if size is None:
+                    logger.warning("%s: not a valid MIDI file, skipping", name)
+                    continue
+                downloaded.append(name)
+                logger.info("Downloaded %s (%d bytes)", name, size)
+            except Exception as e:
+                logger.error("Failed to download %s: %s", name, e)
     return downloaded
 
 
+@functools.lru_cache(maxsize=1)
 def _import_synthesizer():
-    """Import synthesize_preview from midi-bot/src/synthesizer.py via importlib."""
+    """Import midi-bot/src/synthesizer.py via importlib. Returns the module.
+
+    Cached so the module is parsed and executed once per process instead of
+    once per synthesize_ogg call.
+    """
     synth_path = Path(__file__).parent.parent / "midi-bot" / "src" / "synthesizer.py"
     spec = importlib.util.spec_from_file_location("midi_synthesizer", synth_path)
     mod = importlib.util.module_from_spec(spec)
     spec.loader.exec_module(mod)
-    return mod.synthesize_preview
+    return mod
 
 
 def synthesize_ogg(midi_dir: Path) -> bool:
-    """Synthesize MIDI files to OGG via WAV intermediate.
+    """Synthesize MIDI files to OGG.
 
-    Uses the midi-bot synthesizer to generate a WAV preview, then
-    converts to OGG with ffmpeg for smaller file size.
+    Uses the midi-bot synthesizer to render raw PCM in memory and pipes it
+    straight into ffmpeg's stdin for a single-pass Opus encode — no WAV
+    intermediate on disk or in the stream.
 
     Returns True on success, False on failure.
     """
-    wav_path = midi_dir / "preview.wav"
     ogg_path = midi_dir / "preview.ogg"
 
     try:
-        synth_fn = _import_synthesizer()
-        if not synth_fn(midi_dir, wav_path):
+        synth = _import_synthesizer()
+        pcm_bytes = synth.synthesize_pcm(midi_dir)
+        if pcm_bytes is None:
             logger.error("Synthesizer returned failure")
             return False
     except Exception as e:
-        logger.error(f"Synthesis failed: {e}")
+        logger.error("Synthesis failed: %s", e)
         return False
 
     try:
-        result = subprocess.run(
-            ["ffmpeg", "-y", "-i", str(wav_path), "-b:a", "64k", str(ogg_path)],
-            capture_output=True,
-            text=True,
-            timeout=60,
+        proc = subprocess.Popen(
+            ["ffmpeg", "-y",
+             "-f", "s16le", "-ar", str(synth.SAMPLE_RATE), "-ac", "1", "-i", "pipe:0",
+             "-c:a", "libopus", "-b:a", "64k", "-f", "ogg", str(ogg_path)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
         )
-        if result.returncode != 0:
-            logger.error(f"ffmpeg failed: {result.stderr}")
+        try:
+            _, stderr = proc.communicate(pcm_bytes, timeout=60)
+        except subprocess.TimeoutExpired:
+            # communicate() doesn't kill the child on timeout — reap it and
+            # drop the partial file so the entry isn't counted as archived
+            proc.kill()
+            proc.communicate()
+            ogg_path.unlink(missing_ok=True)
+            logger.error("ffmpeg timed out encoding %s", ogg_path)
+            return False
+        if proc.returncode != 0:
+            ogg_path.unlink(missing_ok=True)
+            logger.error("ffmpeg failed: %s", stderr.decode(errors="replace"))
             return False
     except Exception as e:
-        logger.error(f"ffmpeg conversion failed: {e}")
+        logger.error("ffmpeg conversion failed: %s", e)
         return False
-    finally:
-        if wav_path.exists():
-            wav_path.unlink()
 
-    logger.info(f"OGG preview written: {ogg_path}")
+    logger.info("OGG preview written: %s", ogg_path)
     return True
 
 
+def _load_meta(candidate: tuple[str, str]) -> dict | None:
+    """Read one date directory's meta.json into a manifest entry.
+
+    Returns None if the directory has no meta.json or it can't be parsed.
+    """
+    name, path = candidate
+    try:
+        with open(os.path.join(path, "meta.json"), "rb") as fh:
+            meta = _json_loads(fh.read())
+    except FileNotFoundError:
+        return None
+    except (ValueError, OSError) as e:
+        logger.warning("Skipping %s: %s", name, e)
+        return None
+    return {
+        "id": name,
+        "date": meta.get("date", name[:10]),
+        "description": meta.get("description", ""),
+        "scale": meta.get("scale", ""),
+        "root": meta.get("root", ""),
+        "tempo": meta.get("tempo", 0),
+    }
+
+
 def build_manifest(puke_box_dir: Path) -> list[dict]:
     """Build a manifest from date directories containing meta.json.
 
     Scans for directories matching YYYY-MM-DD format that contain a
     meta.json file. Returns a list of manifest entries sorted newest first.
     """
-    entries = []
-    for child in puke_box_dir.iterdir():
-        if not child.is_dir():
-            continue
-        # Match YYYY-MM-DD or YYYY-MM-DD-HHMMSS directories
-        if not re.match(r"^\d{4}-\d{2}-\d{2}(-\d{6})?$", child.name):
-            continue
-        meta_path = child / "meta.json"
-        if not meta_path.exists():
-            continue
-        try:
-            meta = json.loads(meta_path.read_text())
-            entries.append({
-                "id": child.name,
-                "date": meta.get("date", child.name[:10]),
-                "description": meta.get("description", ""),
-                "scale": meta.get("scale", ""),
-                "root": meta.get("root", ""),
-                "tempo": meta.get("tempo", 0),
-            })
-        except (json.JSONDecodeError, OSError) as e:
-            logger.warning(f"Skipping {child.name}: {e}")
-            continue
+    # os.scandir caches the entry type from readdir, so is_dir() costs no
+    # extra stat; the missing-meta.json check is folded into the open()
+    candidates = []
+    with os.scandir(puke_box_dir) as it:
+        for child in it:
+            if not child.is_dir():
+                continue
+            if not _DATE_DIR_RE.match(child.name):
+                continue
+            candidates.append((child.name, child.path))
+
+    # meta.json reads are independent open/read/parse round-trips — run
+    # them concurrently so the archive scan isn't bound by disk latency
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        results = pool.map(_load_meta, candidates)
+    entries = [entry for entry in results if entry is not None]
 
-    entries.sort(key=lambda e: e["id"], reverse=True)
+    entries.sort(key=operator.itemgetter("id"), reverse=True)
     return entries
 
 
@@ -279,7 +470,7 @@ def get_existing_entries(puke_box_dir: Path) -> set[str]:
     for child in puke_box_dir.iterdir():
         if not child.is_dir():
             continue
-        if not re.match(r"^\d{4}-\d{2}-\d{2}(-\d{6})?$", child.name):
+        if not _DATE_DIR_RE.match(child.name):
             continue
         if (child / "preview.ogg").exists():
             entries.add(child.name)
@@ -295,15 +486,16 @@ def run_scraper() -> int:
 
     client = WebClient(token=token)
     channel_id = find_channel_id(client)
-    messages = fetch_midi_messages(client, channel_id)
+
+    cache = _read_channel_cache()
+    messages = fetch_midi_messages(client, channel_id, oldest=cache.get("last_ts"))
 
     existing = get_existing_entries(PUKE_BOX_DIR)
     new_messages = [m for m in messages if m["entry_id"] not in existing]
 
-    logger.info(f"Found {len(new_messages)} new entries to process")
-    if not new_messages:
-        return 0
+    logger.info("Found %d new entries to process", len(new_messages))
 
+    failed = []
     for msg in new_messages:
         entry_dir = PUKE_BOX_DIR / msg["entry_id"]
         entry_dir.mkdir(exist_ok=True)
@@ -313,19 +505,34 @@ def run_scraper() -> int:
         )
         if len(downloaded) < 4:
             logger.warning(
-                f"{msg['entry_id']}: only {len(downloaded)} MIDI files downloaded (expected 4)"
+                "%s: only %d MIDI files downloaded (expected 4)", msg["entry_id"], len(downloaded)
             )
 
         if not synthesize_ogg(entry_dir):
-            logger.warning(f"{msg['entry_id']}: OGG synthesis failed, skipping")
+            logger.warning("%s: OGG synthesis failed, skipping", msg["entry_id"])
+            failed.append(msg)
             continue
 
         meta = {k: v for k, v in msg.items() if k not in ("thread_ts", "entry_id")}
-        (entry_dir / "meta.json").write_text(json.dumps(meta, indent=2) + "\n")
+        (entry_dir / "meta.json").write_bytes(_json_dumps(meta))
+
+    # Advance the high-water mark only now that the loop has run, and never
+    # past a failed entry — anything above the watermark is refetched next
+    # run (oldest is exclusive), so failures retry the way the full rescan
+    # used to. A crash mid-loop leaves the old watermark untouched.
+    ceiling = min(float(m["thread_ts"]) for m in failed) if failed else None
+    done_ts = [m["thread_ts"] for m in messages
+               if ceiling is None or float(m["thread_ts"]) < ceiling]
+    if done_ts:
+        cache["last_ts"] = max(done_ts, key=float)
+        _write_channel_cache(cache)
+
+    if not new_messages:
+        return 0
 
     manifest = build_manifest(PUKE_BOX_DIR)
-    MANIFEST_PATH.write_text(json.dumps(manifest, indent=2) + "\n")
-    logger.info(f"Manifest written with {len(manifest)} entries")
+    MANIFEST_PATH.write_bytes(_json_dumps(manifest))
+    logger.info("Manifest written with %d entries", len(manifest))
 
     return 0
 